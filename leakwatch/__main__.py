@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 
-from .orchestration import PipelineManager
 from .utils.config import get_config
-from .utils.types import DetectionResult
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .orchestration import PipelineManager
+    from .utils.types import DetectionResult
 
 app = typer.Typer(add_completion=False, help="LeakWatch privacy middleware")
 
@@ -22,8 +24,7 @@ def scan_text(
 ):
     """Scan a text file and emit sanitized output + audit trail."""
 
-    cfg = get_config()
-    manager = PipelineManager(cfg)
+    manager = _manager()
     result = manager.process_text(path)
     if output and result.mitigated_output:
         contents = Path(result.mitigated_output).read_text(encoding="utf-8")
@@ -38,8 +39,7 @@ def scan_image(
 ):
     """Scan an image file for privacy leaks."""
 
-    cfg = get_config()
-    manager = PipelineManager(cfg)
+    manager = _manager()
     result = manager.process_image(path, output_path=output)
     typer.echo(_to_json(result))
 
@@ -50,8 +50,7 @@ def scan_audio(
 ):
     """Run audio through placeholder speech-to-text + text pipeline."""
 
-    cfg = get_config()
-    manager = PipelineManager(cfg)
+    manager = _manager()
     result = manager.process_audio(path)
     typer.echo(_to_json(result))
 
@@ -62,8 +61,7 @@ def scan_video(
 ):
     """Extract frames from a video and sanitize them via the image pipeline."""
 
-    cfg = get_config()
-    manager = PipelineManager(cfg)
+    manager = _manager()
     result = manager.process_video(path)
     typer.echo(_to_json(result))
 
@@ -72,13 +70,23 @@ def scan_video(
 def scan_folder(
     path: Path = typer.Argument(..., exists=True, resolve_path=True),
     recursive: bool = typer.Option(True, "--recursive/--no-recursive"),
+    warmup: bool = typer.Option(False, "--warmup/--no-warmup", help="Load and prime the OCR model before scanning"),
 ):
-    """Scan all supported files inside a folder."""
+    """Scan all supported files inside a folder, streaming NDJSON results."""
+
+    manager = _manager()
+    if warmup:
+        manager.image_detector.warmup()
+    # One JSON document per line (NDJSON), emitted as each file finishes.
+    for result in manager.process_folder(path, recursive=recursive):
+        typer.echo(result.model_dump_json())
+
+
+def _manager() -> "PipelineManager":
+    # Imported per command so `--help` and argument errors skip OpenCV/spaCy start-up.
+    from .orchestration import PipelineManager
 
-    cfg = get_config()
-    manager = PipelineManager(cfg)
-    results = manager.process_folder(path, recursive=recursive)
-    typer.echo(json.dumps([r.model_dump() for r in results], indent=2, default=str))
+    return PipelineManager(get_config())
 
 
 def _to_json(result: DetectionResult) -> str:
@@ -5,8 +5,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import List
 
-import cv2
-
 from ..utils.logging import ensure_dir, get_logger
 
 LOGGER = get_logger(__name__)
@@ -43,6 +41,8 @@ class VideoAdapter:
 		self.max_frames = max(1, max_frames)
 
 	def extract_frames(self, video_path: Path, frame_dir: Path) -> List[Path]:
+		import cv2  # deferred so text/audio-only runs never load OpenCV
+
 		frame_dir = Path(frame_dir)
 		frame_dir.mkdir(parents=True, exist_ok=True)
 		capture = cv2.VideoCapture(str(video_path))
@@ -54,10 +54,14 @@ class VideoAdapter:
 		frame_index = 0
 		saved = 0
 		while saved < self.max_frames:
-			ret, frame = capture.read()
+			if frame_index % self.frame_stride == 0:
+				ret, frame = capture.read()
+			else:
+				# grab() advances without decoding; only sampled frames pay for a full decode.
+				ret, frame = capture.grab(), None
 			if not ret:
 				break
-			if frame_index % self.frame_stride == 0:
+			if frame is not None:
 				frame_path = frame_dir / f"{video_path.stem}_frame_{frame_index:05d}.png"
 				ensure_dir(frame_path)
 				cv2.imwrite(str(frame_path), frame)
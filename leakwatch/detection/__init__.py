@@ -1,4 +1,28 @@
 """Detection modules for supported modalities."""
 
-from .text import TextDetector  # noqa: F401
-from .image import ImageDetector  # noqa: F401
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .image import ImageDetector
+    from .text import TextDetector
+
+__all__ = ["ImageDetector", "TextDetector"]
+
+_LAZY_ATTRS = {
+    "ImageDetector": ".image",
+    "TextDetector": ".text",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import detector modules on first access (PEP 562)."""
+
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -2,27 +2,41 @@
 
 from __future__ import annotations
 
+import threading
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Sequence, Tuple, TYPE_CHECKING
 
 import cv2
 import numpy as np
 
-try:  # EasyOCR is optional; the code degrades gracefully without it.
-    import easyocr
-except ImportError:  # pragma: no cover
-    easyocr = None
-
 from ..utils.config import ImageConfig
+from ..utils.imageio import decode_reduction, image_size, read_image
+from ..utils.logging import get_logger
 from ..utils.types import BoundingBox, DetectedEntity, Modality
 
 if TYPE_CHECKING:  # pragma: no cover
     from .text import TextDetector
 
-if easyocr:
-    EasyOcrReader = easyocr.Reader
-else:  # pragma: no cover
-    EasyOcrReader = None  # type: ignore
+LOGGER = get_logger(__name__)
+# EasyOCR readers are shared process-wide and are not re-entrant.
+_OCR_LOCK = threading.Lock()
+# Edge-gate tile side in quarter-scale pixels: a single line of text fills a tile, not a frame.
+EDGE_GATE_TILE = 32
+
+cv2.setUseOptimized(True)
+
+
+@lru_cache(maxsize=4)
+def _get_reader(langs: tuple[str, ...], gpu: bool = False, quantize: bool = True):
+    """Return a process-wide EasyOCR reader; model loading takes seconds, so build it once."""
+
+    try:  # EasyOCR is optional (and pulls in torch), so import it only when OCR runs.
+        import easyocr
+    except ImportError:  # pragma: no cover
+        return None
+    return easyocr.Reader(list(langs), gpu=gpu, quantize=quantize, cudnn_benchmark=True)
 
 
 class ImageDetector:
@@ -37,24 +51,112 @@ class ImageDetector:
         self.config = config
         self.text_labels = tuple(text_labels or ("scene_text",))
         self._text_detector = text_detector
-        cascade_path = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
-        self._face_cascade = cv2.CascadeClassifier(cascade_path)
+        self._face_net = self._load_face_net() if config.face_detector == "yunet" else None
+        self._face_cascade = None
+        if self._face_net is None:
+            cascade_path = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+            self._face_cascade = cv2.CascadeClassifier(cascade_path)
+        self._face_lock = threading.Lock()
+        self._buffers = threading.local()  # per-thread scratch, folder scans run on a pool
         self._ocr_reader = None
 
     def detect(self, path: Path) -> List[DetectedEntity]:
-        image = cv2.imread(str(path))
-        if image is None:
-            raise FileNotFoundError(f"Unable to load image: {path}")
+        return self.detect_batch([path])[0]
+
+    def detect_batch(self, paths: Sequence[Path]) -> List[List[DetectedEntity]]:
+        """Detect entities for several images, sharing one batched OCR pass."""
+
+        return self.detect_and_load(paths)[0]
+
+    def detect_and_load(
+        self, paths: Sequence[Path]
+    ) -> Tuple[List[List[DetectedEntity]], List[np.ndarray | None]]:
+        """Like :meth:`detect_batch`, also returning the decoded images for reuse by mitigation.
+
+        An image decoded at reduced resolution is returned as ``None`` since
+        mitigation needs the full-resolution frame.
+        """
+
+        loaded = [self._load_image(Path(path)) for path in paths]
+        images = [image for image, _ in loaded]
+        text_entities = self._detect_text(images)
+        results: list[list[DetectedEntity]] = []
+        full_images: list[np.ndarray | None] = []
+        for (image, scale), entities in zip(loaded, text_entities):
+            found = [*self._detect_faces(image), *entities]
+            if scale != (1.0, 1.0):
+                self._rescale_bboxes(found, scale)
+                full_images.append(None)
+            else:
+                full_images.append(image)
+            results.append(found)
+        return results, full_images
 
-        entities: list[DetectedEntity] = []
-        entities.extend(self._detect_faces(image))
-        entities.extend(self._detect_text(image))
-        return entities
+    def warmup(self) -> None:
+        """Load the OCR reader and run it once so the first real batch is not slowed down."""
+
+        if not self.config.enable_ocr:
+            return
+        with _OCR_LOCK:
+            if self._ocr_reader is None:
+                self._ocr_reader = self._load_ocr_reader()
+            if self._ocr_reader is not None:
+                blank = np.zeros((self.config.ocr_batch_height, self.config.ocr_batch_width, 3), dtype=np.uint8)
+                self._ocr_reader.readtext_batched([blank])
 
     # --- Internal helpers --------------------------------------------
+    def _load_image(self, path: Path) -> Tuple[np.ndarray, Tuple[float, float]]:
+        """Decode for detection, at reduced resolution for very large images.
+
+        Returns the image plus the factor mapping its coordinates back to
+        the full-resolution frame that mitigation works on.
+        """
+
+        size = image_size(path) if self.config.detect_min_side > 0 else None
+        reduction = decode_reduction(size, self.config.detect_min_side)
+        image = read_image(path, reduction)
+        if reduction == 1 or size is None:
+            return image, (1.0, 1.0)
+        width, height = size
+        return image, (width / image.shape[1], height / image.shape[0])
+
+    @staticmethod
+    def _rescale_bboxes(entities: List[DetectedEntity], scale: Tuple[float, float]) -> None:
+        scale_x, scale_y = scale
+        for entity in entities:
+            if entity.bbox is None:
+                continue
+            box = entity.bbox
+            entity.bbox = BoundingBox(
+                x=int(box.x * scale_x),
+                y=int(box.y * scale_y),
+                width=int(box.width * scale_x),
+                height=int(box.height * scale_y),
+            )
+
+    def _load_face_net(self):
+        model_path = Path(self.config.face_model_path)
+        if not model_path.exists():
+            LOGGER.warning(
+                "YuNet model not found at %s; falling back to Haar cascade. Run scripts/download_models.py.",
+                model_path,
+            )
+            return None
+        return cv2.FaceDetectorYN.create(
+            str(model_path),
+            "",
+            (320, 320),
+            score_threshold=self.config.face_score_threshold,
+        )
+
     def _detect_faces(self, image: np.ndarray) -> Iterable[DetectedEntity]:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        faces = self._face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5)
+        if self._face_net is not None:
+            yield from self._detect_faces_dnn(image)
+            return
+        gray = self._gray_buffer(image.shape[:2])
+        cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=gray)
+        with self._face_lock:
+            faces = self._face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5)
         for (x, y, w, h) in faces:
             yield DetectedEntity(
                 modality=Modality.IMAGE,
@@ -64,30 +166,112 @@ class ImageDetector:
                 mitigation="blur",
             )
 
-    def _detect_text(self, image: np.ndarray) -> Iterable[DetectedEntity]:
-        if not self.config.enable_ocr or EasyOcrReader is None:
+    def _load_ocr_reader(self):
+        return _get_reader(
+            tuple(self.config.text_detection_langs),
+            gpu=False,
+            quantize=self.config.ocr_quantize,
+        )
+
+    def _gray_buffer(self, shape: Tuple[int, int]) -> np.ndarray:
+        gray = getattr(self._buffers, "gray", None)
+        if gray is None or gray.shape != shape:
+            gray = np.empty(shape, dtype=np.uint8)
+            self._buffers.gray = gray
+        return gray
+
+    def _detect_faces_dnn(self, image: np.ndarray) -> Iterable[DetectedEntity]:
+        height, width = image.shape[:2]
+        with self._face_lock:
+            self._face_net.setInputSize((width, height))
+            _, faces = self._face_net.detect(image)
+        if faces is None:
+            return
+        for face in faces:
+            # YuNet reports faces cut by the frame edge with boxes reaching past it; clip to the frame.
+            x, y, w, h = (int(v) for v in face[:4])
+            x0, y0 = max(0, x), max(0, y)
+            x1, y1 = min(width, x + w), min(height, y + h)
+            if x1 <= x0 or y1 <= y0:
+                continue
+            yield DetectedEntity(
+                modality=Modality.IMAGE,
+                label="face",
+                confidence=float(face[-1]),
+                bbox=BoundingBox(x=x0, y=y0, width=x1 - x0, height=y1 - y0),
+                mitigation="blur",
+            )
+
+    def _detect_text(self, images: Sequence[np.ndarray]) -> List[List[DetectedEntity]]:
+        if not images:
             return []
-        if self._ocr_reader is None:
-            self._ocr_reader = EasyOcrReader(list(self.config.text_detection_langs), gpu=False)
+        results: list[list[DetectedEntity]] = [[] for _ in images]
+        if not self.config.enable_ocr:
+            return results
+        # Images without any edge structure cannot hold text; keep them away from the OCR model.
+        candidates = [index for index, image in enumerate(images) if self._has_text_hint(image)]
+        if not candidates:
+            return results
+
+        frames = [cv2.cvtColor(images[index], cv2.COLOR_BGR2RGB) for index in candidates]
+        # Only same-shaped frames (e.g. sampled video) share a batch. Stretching a mixed batch to
+        # one size would distort portraits and shrink large scans until their small text is lost.
+        groups: dict[tuple[int, ...], list[int]] = {}
+        for position, frame in enumerate(frames):
+            groups.setdefault(frame.shape, []).append(position)
+        detections: list[Sequence[Tuple[Sequence[Tuple[float, float]], str, float]]] = [[] for _ in frames]
 
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        detections = self._ocr_reader.readtext(rgb_image)
+        with _OCR_LOCK:
+            if self._ocr_reader is None:
+                self._ocr_reader = self._load_ocr_reader()
+            if self._ocr_reader is None:
+                return results
+            for positions in groups.values():
+                if len(positions) == 1:
+                    batched = [self._ocr_reader.readtext(frames[positions[0]])]
+                else:
+                    batched = self._ocr_reader.readtext_batched([frames[position] for position in positions])
+                for position, found in zip(positions, batched):
+                    detections[position] = found
+
+        for index, found in zip(candidates, detections):
+            results[index] = self._entities_from_ocr(found)
+        return results
+
+    def _has_text_hint(self, image: np.ndarray) -> bool:
+        """Cheap Canny edge-density gate run on a quarter-scale copy before OCR.
+
+        The densest tile is what counts, so one short line on a blank page still passes.
+        """
+
+        threshold = self.config.ocr_edge_gate
+        if threshold <= 0:
+            return True
+        small = image
+        if min(image.shape[:2]) >= 32:
+            small = cv2.resize(image, None, fx=0.25, fy=0.25, interpolation=cv2.INTER_AREA)
+        edges = cv2.Canny(cv2.cvtColor(small, cv2.COLOR_BGR2GRAY), 80, 160)
+        rows, cols = -(-edges.shape[0] // EDGE_GATE_TILE), -(-edges.shape[1] // EDGE_GATE_TILE)
+        # Area resampling averages each tile's edge pixels (255 each) into one cell.
+        tiles = cv2.resize(edges, (cols, rows), interpolation=cv2.INTER_AREA)
+        return int(tiles.max()) / 255 >= threshold
+
+    def _entities_from_ocr(
+        self,
+        detections: Sequence[Tuple[Sequence[Tuple[float, float]], str, float]],
+    ) -> List[DetectedEntity]:
+        kept = [det for det in detections if det[2] >= self.config.min_confidence]
+        if not kept:
+            return []
+        bboxes = self._bboxes_from_points([det[0] for det in kept])
+        texts = [det[1] for det in kept]
+        nested_batches = self._text_detector.detect_many(texts) if self._text_detector else [[] for _ in texts]
         results: list[DetectedEntity] = []
-        for bbox_points, text, confidence in detections:
-            if confidence < self.config.min_confidence:
-                continue
-            bbox = self._bbox_from_points(bbox_points)
-            nested_entities = self._text_detector.detect(text) if self._text_detector else []
+        for (_, text, confidence), bbox, nested_entities in zip(kept, bboxes, nested_batches):
             if nested_entities:
                 for nested in nested_entities:
                     results.append(
-                        nested.model_copy(
-                            update={
-                                "modality": Modality.IMAGE,
-                                "bbox": bbox,
-                                "confidence": float(confidence),
-                            }
-                        )
+                        replace(nested, modality=Modality.IMAGE, bbox=bbox, confidence=float(confidence))
                     )
             else:
                 results.append(
@@ -103,14 +287,15 @@ class ImageDetector:
         return results
 
     @staticmethod
-    def _bbox_from_points(points: Sequence[Tuple[float, float]]) -> BoundingBox:
-        xs = [p[0] for p in points]
-        ys = [p[1] for p in points]
-        x_min, x_max = min(xs), max(xs)
-        y_min, y_max = min(ys), max(ys)
-        return BoundingBox(
-            x=int(x_min),
-            y=int(y_min),
-            width=int(x_max - x_min),
-            height=int(y_max - y_min),
-        )
+    def _bboxes_from_points(
+        points: Sequence[Sequence[Tuple[float, float]]],
+    ) -> List[BoundingBox]:
+        """Reduce OCR quads to axis-aligned boxes in one vectorized pass."""
+
+        quads = np.asarray(points, dtype=np.float32).reshape(len(points), -1, 2)
+        mins = quads.min(axis=1)
+        sizes = (quads.max(axis=1) - mins).astype(int)
+        return [
+            BoundingBox(x=x, y=y, width=w, height=h)
+            for (x, y), (w, h) in zip(mins.astype(int).tolist(), sizes.tolist())
+        ]
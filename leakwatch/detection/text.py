@@ -3,25 +3,227 @@
 from __future__ import annotations
 
 import re
+import threading
 from dataclasses import dataclass
-from typing import Iterable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
 
-try:  # spaCy is optional at runtime
-    import spacy
-    from spacy.language import Language
+try:  # the regex parser moved under ``re`` in Python 3.11
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover
+    import sre_parse
+
+try:  # Hyperscan is optional; it only pre-filters which regexes need a full pass.
+    import hyperscan
+except ImportError:  # pragma: no cover
+    hyperscan = None
+
+try:  # google-re2 is optional; its RE2::Set stands in for Hyperscan where no wheel exists (Windows).
+    import re2
+except ImportError:  # pragma: no cover
+    re2 = None
+
+try:  # pyahocorasick is optional; keyword-list patterns fall back to ``re`` without it.
+    import ahocorasick
 except ImportError:  # pragma: no cover
-    spacy = None
-    Language = None  # type: ignore
+    ahocorasick = None
 
 from ..utils.config import TextConfig
 from ..utils.types import DetectedEntity, Modality, Span
 
+if TYPE_CHECKING:  # pragma: no cover
+    from spacy.language import Language
+    from spacy.tokens import Doc
+
+SPACY_LABELS = {"PERSON", "GPE", "ORG", "CARDINAL", "MONEY"}
+# Only NER output is consumed; everything else in the pipeline is wasted work.
+SPACY_KEEP_PIPES = ("tok2vec", "ner")
+SPACY_BATCH_SIZE = 64
+# One alternative of a pure keyword list: no metacharacters other than escaped punctuation.
+_LITERAL_ALTERNATIVE_RE = re.compile(r"(?:[^\\.^$*+?{}\[\]|()]|\\[^A-Za-z0-9])+")
+_ESCAPED_CHAR_RE = re.compile(r"\\(.)")
+
 
 @dataclass
 class _RegexPattern:
     name: str
     pattern: re.Pattern[str]
     action: str
+    keywords: tuple[str, ...] = ()  # lower-cased alternatives when served by Aho-Corasick
+
+
+def _literal_alternatives(pattern: str) -> tuple[str, ...]:
+    """Return the keywords of a ``foo|bar|baz`` style pattern, or ``()`` if it is a real regex."""
+
+    if "\\\\" in pattern:
+        return ()
+    alternatives = pattern.split("|")
+    if not all(_LITERAL_ALTERNATIVE_RE.fullmatch(alt) for alt in alternatives):
+        return ()
+    return tuple(_ESCAPED_CHAR_RE.sub(r"\1", alt) for alt in alternatives)
+
+
+_REPEATS = {sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, getattr(sre_parse, "POSSESSIVE_REPEAT", None)}
+
+
+def _required_bytes(pattern: re.Pattern[str]) -> frozenset[int] | None:
+    """ASCII bytes of which every match of ``pattern`` contains at least one, if that can be derived.
+
+    Only used to rule patterns out for ASCII text, where ``\\d`` and case folding stay ASCII.
+    """
+
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+        return _sequence_required(parsed, bool(parsed.state.flags & re.IGNORECASE))
+    except Exception:  # private parser API: anything unexpected means "always run this pattern"
+        return None
+
+
+def _sequence_required(items: Any, ignorecase: bool) -> frozenset[int] | None:
+    # Every item of a sequence must match, so the most selective item speaks for all of it.
+    best = None
+    for op, av in items:
+        required = _item_required(op, av, ignorecase)
+        if required is not None and (best is None or len(required) < len(best)):
+            best = required
+    return best
+
+
+def _item_required(op: Any, av: Any, ignorecase: bool) -> frozenset[int] | None:
+    if op in _REPEATS:
+        low, _, item = av
+        return _sequence_required(item, ignorecase) if low else None
+    if op is sre_parse.SUBPATTERN:
+        _, add_flags, del_flags, item = av
+        return None if add_flags or del_flags else _sequence_required(item, ignorecase)
+    if op is sre_parse.BRANCH:
+        branches = [_sequence_required(branch, ignorecase) for branch in av[1]]
+        return None if None in branches else frozenset().union(*branches)
+    if op is sre_parse.LITERAL:
+        chars = {av}
+    elif op is sre_parse.IN:
+        chars = set()
+        for member_op, member_av in av:
+            if member_op is sre_parse.LITERAL:
+                chars.add(member_av)
+            elif member_op is sre_parse.RANGE:
+                chars.update(range(member_av[0], member_av[1] + 1))
+            elif member_op is sre_parse.CATEGORY and member_av is sre_parse.CATEGORY_DIGIT:
+                chars.update(range(ord("0"), ord("9") + 1))
+            else:  # negated sets and the wider categories match too much to be worth tracking
+                return None
+    else:
+        return None
+    if any(char > 0x7F for char in chars):  # folds such as U+212A -> "k" would escape the table
+        return None
+    if ignorecase:
+        chars |= {ord(chr(char).swapcase()) for char in chars}
+    return frozenset(chars)
+
+
+_CATEGORY_SOURCES = {
+    sre_parse.CATEGORY_DIGIT: r"\d",
+    sre_parse.CATEGORY_NOT_DIGIT: r"\D",
+    sre_parse.CATEGORY_SPACE: r"\s",
+    sre_parse.CATEGORY_NOT_SPACE: r"\S",
+    sre_parse.CATEGORY_WORD: r"\w",
+    sre_parse.CATEGORY_NOT_WORD: r"\W",
+}
+# ``re`` and the engines agree what ``^`` and ``\b`` mean on ASCII text; other assertions are dropped.
+_PORTABLE_ANCHORS = {sre_parse.AT_BEGINNING: "^", sre_parse.AT_BEGINNING_STRING: "^"}
+_PORTABLE_BOUNDARIES = {sre_parse.AT_BOUNDARY: r"\b", sre_parse.AT_NON_BOUNDARY: r"\B"}
+_NO_ASCII = r"[^\x00-\x7f]"  # a class that cannot match ASCII text
+
+
+def _portable_pattern(pattern: re.Pattern[str]) -> str | None:
+    """Rewrite ``pattern`` for the Hyperscan / RE2 prefilters, or ``None`` if it must always run.
+
+    The rewrite matches, on ASCII text, at least wherever ``re`` finds a match:
+    every character class is spelled out as the ASCII bytes ``re`` accepts there
+    (so ``\\s``, ``{,n}`` and ``$`` never reach the engines' own dialects), and
+    assertions the dialects disagree on are dropped, which only widens it.
+    """
+
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+        if parsed.state.flags & re.LOCALE:
+            return None
+        return _portable_sequence(parsed, parsed.state.flags)
+    except Exception:  # private parser API: anything unexpected means "not rewritable"
+        return None
+
+
+def _portable_sequence(items: Any, flags: int) -> str | None:
+    parts = []
+    for op, av in items:
+        part = _portable_item(op, av, flags)
+        if part is None:
+            return None
+        parts.append(part)
+    return "".join(parts)
+
+
+def _portable_item(op: Any, av: Any, flags: int) -> str | None:
+    if op is sre_parse.LITERAL:
+        return _ascii_class(re.escape(chr(av)), flags)
+    if op is sre_parse.NOT_LITERAL:
+        return _ascii_class(f"[^{re.escape(chr(av))}]", flags)
+    if op is sre_parse.ANY:
+        return _ascii_class(".", flags)
+    if op is sre_parse.IN:
+        members = []
+        for member_op, member_av in av:
+            if member_op is sre_parse.NEGATE:
+                members.append("^")
+            elif member_op is sre_parse.LITERAL:
+                members.append(re.escape(chr(member_av)))
+            elif member_op is sre_parse.RANGE:
+                members.append(f"{re.escape(chr(member_av[0]))}-{re.escape(chr(member_av[1]))}")
+            else:
+                members.append(_CATEGORY_SOURCES[member_av])
+        return _ascii_class(f"[{''.join(members)}]", flags)
+    if op is sre_parse.AT:
+        if av in _PORTABLE_BOUNDARIES:
+            return _PORTABLE_BOUNDARIES[av]
+        return "" if flags & re.MULTILINE else _PORTABLE_ANCHORS.get(av, "")
+    if op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+        return ""
+    if op in _REPEATS:
+        low, high, item = av
+        body = _portable_sequence(item, flags)
+        if body is None:
+            return None
+        return f"(?:{body}){{{low},{'' if high == sre_parse.MAXREPEAT else high}}}"
+    if op is sre_parse.SUBPATTERN:
+        _, add_flags, del_flags, item = av
+        body = _portable_sequence(item, (flags | add_flags) & ~del_flags)
+        return None if body is None else f"(?:{body})"
+    if op is getattr(sre_parse, "ATOMIC_GROUP", None):  # backtracking into it only widens the match
+        body = _portable_sequence(av, flags)
+        return None if body is None else f"(?:{body})"
+    if op is sre_parse.BRANCH:
+        branches = [_portable_sequence(branch, flags) for branch in av[1]]
+        return None if None in branches else f"(?:{'|'.join(branches)})"
+    return None  # backreferences, conditionals
+
+
+@lru_cache(maxsize=4096)
+def _ascii_class(source: str, flags: int) -> str:
+    """The ASCII characters one-character ``source`` accepts under ``flags``, as an explicit class."""
+
+    matcher = re.compile(source, flags & ~re.VERBOSE)
+    members = [code for code in range(0x80) if matcher.fullmatch(chr(code))]
+    if not members:
+        return _NO_ASCII
+    ranges = []
+    for code in members:
+        if ranges and ranges[-1][1] == code - 1:
+            ranges[-1][1] = code
+        else:
+            ranges.append([code, code])
+    return "[" + "".join(
+        f"\\x{low:02x}" if low == high else f"\\x{low:02x}-\\x{high:02x}" for low, high in ranges
+    ) + "]"
 
 
 class TextDetector:
@@ -30,32 +232,67 @@ class TextDetector:
     def __init__(self, config: TextConfig, model: str = "en_core_web_sm") -> None:
         self.config = config
         self._nlp: Language | None = None
+        # spaCy pipelines are not safe to share across threads; Hyperscan gets per-thread scratch instead.
+        self._lock = threading.Lock()
+        self._scratch = threading.local()
         self._patterns = [
-            _RegexPattern(item.name, re.compile(item.pattern, re.IGNORECASE), item.action)
+            _RegexPattern(item.name, item.compiled, item.action)
             for item in config.regex_entities
         ]
-        if config.enable_spacy and spacy is not None:
-            try:
-                self._nlp = spacy.load(model)
-            except OSError:
-                self._nlp = None
+        self._automaton = self._build_automaton()
+        self._regex_ids = {index for index, item in enumerate(self._patterns) if not item.keywords}
+        self._unfiltered_ids: set[int] = set()  # regex patterns the prefilter cannot rule out
+        self._portable = {index: _portable_pattern(self._patterns[index].pattern) for index in self._regex_ids}
+        self._prefilter = self._build_prefilter()
+        self._re2_set, self._re2_ids = self._build_re2_set() if self._prefilter is None else (None, [])
+        # Last-resort gate without either engine: patterns whose required bytes are absent are skipped.
+        self._required = {index: _required_bytes(self._patterns[index].pattern) for index in self._regex_ids}
+        interesting = frozenset().union(*(required for required in self._required.values() if required))
+        self._boring_bytes = bytes(byte for byte in range(0x80) if byte not in interesting)
+        if config.enable_spacy:
+            self._nlp = self._load_spacy(model)
+
+    @staticmethod
+    def _load_spacy(model: str) -> "Language | None":
+        try:  # spaCy is optional at runtime and slow to import, so load it on demand
+            import spacy
+        except ImportError:  # pragma: no cover
+            return None
+        try:
+            nlp = spacy.load(model)
+        except OSError:
+            return None
+        nlp.select_pipes(disable=[name for name in nlp.pipe_names if name not in SPACY_KEEP_PIPES])
+        return nlp
 
     def detect(self, text: str) -> list[DetectedEntity]:
-        if not text:
-            return []
+        return self.detect_many([text])[0]
 
-        entities: list[DetectedEntity] = []
-        entities.extend(self._spacy_entities(text))
-        entities.extend(self._regex_entities(text))
-        return entities
+    def detect_many(self, texts: Sequence[str]) -> list[list[DetectedEntity]]:
+        """Detect entities for several texts, batching spaCy inference via ``nlp.pipe``."""
 
-    def _spacy_entities(self, text: str) -> Iterable[DetectedEntity]:
+        spacy_entities = self._spacy_entities(texts)
+        return [
+            [*ents, *self._regex_entities(text)] if text else []
+            for text, ents in zip(texts, spacy_entities)
+        ]
+
+    def _spacy_entities(self, texts: Sequence[str]) -> list[list[DetectedEntity]]:
         if not self._nlp:
-            return []
-        doc = self._nlp(text[: self.config.max_doc_length])
+            return [[] for _ in texts]
+        indexed = [(index, text[: self.config.max_doc_length]) for index, text in enumerate(texts) if text]
+        results: list[list[DetectedEntity]] = [[] for _ in texts]
+        with self._lock:
+            docs = list(self._nlp.pipe((text for _, text in indexed), batch_size=SPACY_BATCH_SIZE))
+        for (index, _), doc in zip(indexed, docs):
+            results[index] = self._entities_from_doc(doc)
+        return results
+
+    @staticmethod
+    def _entities_from_doc(doc: "Doc") -> list[DetectedEntity]:
         results: list[DetectedEntity] = []
         for ent in doc.ents:
-            if ent.label_ in {"PERSON", "GPE", "ORG", "CARDINAL", "MONEY"}:
+            if ent.label_ in SPACY_LABELS:
                 results.append(
                     DetectedEntity(
                         modality=Modality.TEXT,
@@ -67,17 +304,170 @@ class TextDetector:
                 )
         return results
 
+    def _build_automaton(self) -> Any:
+        """Move keyword-list patterns onto a single Aho-Corasick automaton, if available."""
+
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for index, item in enumerate(self._patterns):
+            keywords = tuple(keyword.lower() for keyword in _literal_alternatives(item.pattern.pattern))
+            if not keywords or not all(keyword.isascii() for keyword in keywords):
+                continue
+            item.keywords = keywords
+            for priority, keyword in enumerate(keywords):
+                owners = automaton.get(keyword, [])
+                owners.append((index, priority, len(keyword)))
+                automaton.add_word(keyword, owners)
+        if not any(item.keywords for item in self._patterns):
+            return None
+        automaton.make_automaton()
+        return automaton
+
+    def _build_prefilter(self):
+        """Compile all patterns into one Hyperscan database, if available.
+
+        Prefilter mode accepts a superset of each (rewritten) regex, so it can
+        only rule patterns out; the surviving ones still run through ``re`` to
+        keep the exact match semantics (leftmost, non-overlapping spans).
+        """
+
+        if hyperscan is None or not self._regex_ids:
+            return None
+        regex_ids = sorted(index for index in self._regex_ids if self._portable[index] is not None)
+        self._unfiltered_ids = self._regex_ids - set(regex_ids)
+        database = self._compile_prefilter(regex_ids) if regex_ids else None
+        if database is None and regex_ids:
+            # One unsupported pattern should not cost the others their prefilter: keep the ones
+            # Hyperscan accepts and always run the rest through ``re``.
+            supported = [index for index in regex_ids if self._compile_prefilter([index]) is not None]
+            self._unfiltered_ids |= set(regex_ids) - set(supported)
+            database = self._compile_prefilter(supported) if supported else None
+        return database
+
+    def _build_re2_set(self) -> tuple[Any, list[int]]:
+        """Compile the regex patterns into one RE2 set, if google-re2 is available.
+
+        Like the Hyperscan database this only narrows the candidates, and it is
+        built from the same ASCII rewrites, so it is consulted for ASCII text only.
+        """
+
+        regex_ids = sorted(self._regex_ids)
+        if re2 is None or not regex_ids:
+            return None, []
+        options = re2.Options()
+        options.case_sensitive = False
+        options.log_errors = False  # unsupported patterns are handled below, not logged by absl
+        regex_set = re2.Set.SearchSet(options)
+        set_ids: list[int] = []
+        for index in regex_ids:
+            if self._portable[index] is None:
+                self._unfiltered_ids.add(index)
+                continue
+            try:
+                regex_set.Add(self._portable[index])
+            except re2.error:  # e.g. repeat counts above RE2's limit of 1000
+                self._unfiltered_ids.add(index)
+                continue
+            set_ids.append(index)
+        if not set_ids:
+            return None, []
+        regex_set.Compile()
+        return regex_set, set_ids
+
+    def _compile_prefilter(self, ids: list[int]):
+        # Rewritten patterns are pure ASCII and only ever scanned against ASCII text.
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH
+        database = hyperscan.Database()
+        try:
+            database.compile(
+                expressions=[self._portable[index].encode("ascii") for index in ids],
+                ids=ids,
+                elements=len(ids),
+                flags=[flags] * len(ids),
+            )
+        except hyperscan.error:
+            return None
+        return database
+
+    def _candidate_patterns(self, text: str) -> set[int]:
+        """Indices of regex (non-keyword) patterns that may match ``text``."""
+
+        if self._prefilter is None:
+            if self._re2_set is not None and text.isascii():
+                matched = self._re2_set.Match(text) or ()  # RE2 returns None for no match
+                return {self._re2_ids[position] for position in matched} | self._unfiltered_ids
+            return self._gated_patterns(text)
+        if not text.isascii():  # the rewritten patterns only stand in for ``re`` on ASCII text
+            return self._regex_ids
+        hits: set[int] = set(self._unfiltered_ids)
+
+        def on_match(pattern_id: int, start: int, end: int, flags: int, context: object) -> None:
+            hits.add(pattern_id)
+
+        scratch = getattr(self._scratch, "space", None)
+        if scratch is None:
+            scratch = self._scratch.space = hyperscan.Scratch(self._prefilter)
+        self._prefilter.scan(text.encode("ascii"), match_event_handler=on_match, scratch=scratch)
+        return hits
+
+    def _gated_patterns(self, text: str) -> set[int]:
+        """Regex patterns that may match ``text`` judging only by which ASCII bytes it contains."""
+
+        if not text.isascii():
+            return self._regex_ids
+        # ``translate`` drops the uninteresting bytes in C, so only the rest is ever looked at.
+        present = set(text.encode("ascii").translate(None, self._boring_bytes))
+        return {
+            index
+            for index, required in self._required.items()
+            if required is None or not required.isdisjoint(present)
+        }
+
+    def _keyword_spans(self, text: str) -> dict[int, list[tuple[int, int]]] | None:
+        """Scan every keyword pattern at once; ``None`` means fall back to ``re``.
+
+        Matches are reduced to what ``re.finditer`` would report: leftmost first,
+        earliest alternative wins at a position, no overlaps.
+        """
+
+        if not text.isascii():  # ``re`` folds further than ``str.lower`` ("ſ" matches "s")
+            return None
+        lowered = text.lower()
+        candidates: dict[int, list[tuple[int, int, int]]] = {}
+        for end_index, owners in self._automaton.iter(lowered):
+            for index, priority, length in owners:
+                candidates.setdefault(index, []).append((end_index - length + 1, priority, end_index + 1))
+        spans: dict[int, list[tuple[int, int]]] = {}
+        for index, matches in candidates.items():
+            matches.sort()
+            cursor = 0
+            selected = spans.setdefault(index, [])
+            for start, _, end in matches:
+                if start >= cursor:
+                    selected.append((start, end))
+                    cursor = end
+        return spans
+
     def _regex_entities(self, text: str) -> Iterable[DetectedEntity]:
+        candidates = self._candidate_patterns(text)
+        keyword_spans = self._keyword_spans(text) if self._automaton is not None else None
         results: list[DetectedEntity] = []
-        for pattern in self._patterns:
-            for match in pattern.pattern.finditer(text):
+        for index, pattern in enumerate(self._patterns):
+            if pattern.keywords and keyword_spans is not None:
+                spans = keyword_spans.get(index, [])
+            elif pattern.keywords or index in candidates:
+                spans = [match.span() for match in pattern.pattern.finditer(text)]
+            else:
+                continue
+            for start, end in spans:
                 results.append(
                     DetectedEntity(
                         modality=Modality.TEXT,
                         label=pattern.name,
                         confidence=0.95,
-                        text=match.group(0),
-                        span=Span(start=match.start(), end=match.end()),
+                        text=text[start:end],
+                        span=Span(start=start, end=end),
                         mitigation=pattern.action,  # pre-select desired action
                     )
                 )
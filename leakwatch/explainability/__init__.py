@@ -1,11 +1,37 @@
 """Explainability utilities for LeakWatch outputs."""
 
-from .audit import record_audit  # noqa: F401
-from .image import render_image_overlay  # noqa: F401
-from .text import render_text_spans  # noqa: F401
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+	from .audit import AuditLogger, record_audit
+	from .image import render_image_overlay
+	from .text import render_text_spans
 
 __all__ = [
+	"AuditLogger",
 	"record_audit",
 	"render_image_overlay",
 	"render_text_spans",
 ]
+
+# Overlays pull in OpenCV; text-only runs never pay for it.
+_LAZY_ATTRS = {
+	"AuditLogger": ".audit",
+	"record_audit": ".audit",
+	"render_image_overlay": ".image",
+	"render_text_spans": ".text",
+}
+
+
+def __getattr__(name: str) -> Any:
+	"""Import explainability modules on first access (PEP 562)."""
+
+	module_name = _LAZY_ATTRS.get(name)
+	if module_name is None:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	value = getattr(import_module(module_name, __name__), name)
+	globals()[name] = value
+	return value
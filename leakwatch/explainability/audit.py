@@ -3,16 +3,62 @@
 from __future__ import annotations
 
 import json
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
+
+try:  # orjson is optional; stdlib json is the fallback encoder.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 from ..utils.config import ExplainabilityConfig
 from ..utils.logging import ensure_dir
 from ..utils.types import DetectionResult
 
 
+class AuditLogger:
+    """Append JSONL audit entries through one long-lived, buffered handle.
+
+    Reuse a single instance across a batch (e.g. folder scans) to avoid
+    reopening the log per result; entries hit disk on ``flush``/``close``.
+    """
+
+    def __init__(self, path: Path, buffer_size: int = 1 << 20) -> None:
+        self.path = Path(path)
+        ensure_dir(self.path)
+        self._handle = self.path.open("ab", buffering=buffer_size)
+        self._lock = threading.Lock()
+
+    def write(self, result: DetectionResult) -> Path:
+        line = _dumps(_audit_entry(result)) + b"\n"
+        with self._lock:
+            self._handle.write(line)
+        return self.path
+
+    def flush(self) -> None:
+        with self._lock:
+            self._handle.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._handle.close()
+
+    def __enter__(self) -> "AuditLogger":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
 def record_audit(result: DetectionResult, config: ExplainabilityConfig) -> Path:
-    entry = {
+    with AuditLogger(config.audit_log_path) as audit_logger:
+        return audit_logger.write(result)
+
+
+def _audit_entry(result: DetectionResult) -> dict[str, Any]:
+    return {
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "modality": result.modality.value,
         "source": str(result.source_path),
@@ -24,15 +70,25 @@ def record_audit(result: DetectionResult, config: ExplainabilityConfig) -> Path:
                 "label": ent.label,
                 "confidence": ent.confidence,
                 "text": ent.text,
-                "span": ent.span.model_dump() if ent.span else None,
-                "bbox": ent.bbox.model_dump() if ent.bbox else None,
+                "span": {"start": ent.span.start, "end": ent.span.end} if ent.span else None,
+                "bbox": (
+                    {
+                        "x": ent.bbox.x,
+                        "y": ent.bbox.y,
+                        "width": ent.bbox.width,
+                        "height": ent.bbox.height,
+                    }
+                    if ent.bbox
+                    else None
+                ),
                 "mitigation": ent.mitigation,
             }
             for ent in result.entities
         ],
     }
-    audit_path = Path(config.audit_log_path)
-    ensure_dir(audit_path)
-    with audit_path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(entry) + "\n")
-    return audit_path
+
+
+def _dumps(entry: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(entry)
+    return json.dumps(entry).encode("utf-8")
@@ -1,4 +1,29 @@
 """Mitigation strategies for sensitive content."""
 
-from .text import TextMitigator  # noqa: F401
-from .image import ImageMitigator  # noqa: F401
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .image import ImageMitigator
+    from .text import TextMitigator
+
+__all__ = ["ImageMitigator", "TextMitigator"]
+
+# The image mitigator pulls in OpenCV; text-only runs never pay for it.
+_LAZY_ATTRS = {
+    "ImageMitigator": ".image",
+    "TextMitigator": ".text",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import mitigator modules on first access (PEP 562)."""
+
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -2,21 +2,38 @@
 
 from __future__ import annotations
 
+import mmap
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cached_property, lru_cache, partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+import numpy as np
 
 from ..adapters import AudioAdapter, VideoAdapter
-from ..detection import ImageDetector, TextDetector
-from ..explainability.audit import record_audit
-from ..explainability.image import render_image_overlay
+from ..detection.text import TextDetector
+from ..explainability.audit import AuditLogger, record_audit
 from ..explainability.text import render_text_spans
-from ..mitigation import ImageMitigator, TextMitigator
-from ..utils.config import LeakWatchConfig, get_config
+from ..mitigation.text import TextMitigator
+from ..utils.config import ImageConfig, LeakWatchConfig, TextConfig, get_config
 from ..utils.logging import ensure_dir, get_logger
 from ..utils.types import DetectedEntity, DetectionResult, Modality
 
+if TYPE_CHECKING:  # pragma: no cover
+    from ..detection.image import ImageDetector
+    from ..mitigation.image import ImageMitigator
+
 LOGGER = get_logger(__name__)
 TEXT_EXTENSIONS = {".txt", ".md", ".json"}
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp"}
+MAX_FOLDER_WORKERS = 8
+
+# Encodes a sanitized image to a path; ImageMitigator.mitigate's ``write`` hook.
+ImageWriter = Callable[[Path, np.ndarray], object]
+# A job names a PipelineManager method taking a list of paths, so it can be shipped to worker processes.
+Job = tuple[str, list[Path]]
 
 
 class PipelineManager:
@@ -24,23 +41,34 @@ class PipelineManager:
 
     def __init__(self, config: LeakWatchConfig | None = None) -> None:
         self.config = config or get_config()
-        self.text_detector = TextDetector(self.config.text)
+        text_key = self.config.text.model_dump_json()
+        self.text_detector = _get_text_detector(text_key)
         self.text_mitigator = TextMitigator(self.config.text)
-        self.image_detector = ImageDetector(self.config.image, text_detector=self.text_detector)
-        self.image_mitigator = ImageMitigator(self.config.image)
         self.audio_adapter = AudioAdapter()
         self.video_adapter = VideoAdapter()
 
+    # Image components (and with them OpenCV) load on first use, so text/audio runs never import them.
+    @cached_property
+    def image_detector(self) -> "ImageDetector":
+        return _get_image_detector(self.config.image.model_dump_json(), self.config.text.model_dump_json())
+
+    @cached_property
+    def image_mitigator(self) -> "ImageMitigator":
+        from ..mitigation.image import ImageMitigator
+
+        return ImageMitigator(self.config.image)
+
     # --- Text Modality -------------------------------------------------
-    def process_text(self, path: Path) -> DetectionResult:
+    def process_text(self, path: Path, *, audit_logger: AuditLogger | None = None) -> DetectionResult:
         source_path = Path(path)
-        raw_text = source_path.read_text(encoding="utf-8")
+        raw_text = _read_text(source_path)
         LOGGER.info("Processing text: %s", source_path.name)
         return self._process_text_payload(
             source_path,
             raw_text,
             suffix=".sanitized.txt",
             modality=Modality.TEXT,
+            audit_logger=audit_logger,
         )
 
     # --- Audio Modality ----------------------------------------------
@@ -63,15 +91,58 @@ class PipelineManager:
         return result
 
     # --- Image Modality -----------------------------------------------
-    def process_image(self, path: Path, output_path: Path | None = None) -> DetectionResult:
+    def process_image(
+        self, path: Path, output_path: Path | None = None, *, audit_logger: AuditLogger | None = None
+    ) -> DetectionResult:
         source_path = Path(path)
         LOGGER.info("Processing image: %s", source_path.name)
-        entities = self.image_detector.detect(source_path)
+        (entities,), (image,) = self.image_detector.detect_and_load([source_path])
+        return self._mitigate_image(source_path, entities, output_path, image=image, audit_logger=audit_logger)
+
+    def process_images(
+        self,
+        paths: list[Path],
+        *,
+        audit_logger: AuditLogger | None = None,
+        write: ImageWriter | None = None,
+    ) -> list[DetectionResult]:
+        """Sanitize several images, running OCR over them as a single batch.
+
+        ``write`` replaces the synchronous encoder for the sanitized images, e.g. to
+        encode them in the background; the caller owns waiting for it to finish.
+        """
+
+        source_paths = [Path(path) for path in paths]
+        LOGGER.info("Processing image batch: %d file(s)", len(source_paths))
+        # Mitigation reuses the detector's decode instead of reading each file a second time.
+        batched_entities, images = self.image_detector.detect_and_load(source_paths)
+        return [
+            self._mitigate_image(source_path, entities, image=image, audit_logger=audit_logger, write=write)
+            for source_path, entities, image in zip(source_paths, batched_entities, images)
+        ]
+
+    def _mitigate_image(
+        self,
+        source_path: Path,
+        entities: list[DetectedEntity],
+        output_path: Path | None = None,
+        image: np.ndarray | None = None,
+        audit_logger: AuditLogger | None = None,
+        write: ImageWriter | None = None,
+    ) -> DetectionResult:
         final_output = output_path or self._output_path(source_path, suffix=f".sanitized{source_path.suffix}")
         ensure_dir(final_output)
-        mitigated_path, mitigated_entities = self.image_mitigator.mitigate(source_path, entities, final_output)
+        from ..explainability.image import render_image_overlay
+        from ..utils.imageio import write_image
+
+        save_overlay = self.config.explainability.save_image_overlays
+        if write is None or save_overlay:  # the overlay re-reads the sanitized file, so it must exist
+            write = write_image
+        mitigated_path, mitigated_entities = self.image_mitigator.mitigate(
+            source_path, entities, final_output, write=write, image=image
+        )
         artifacts = []
-        if self.config.explainability.save_image_overlays and mitigated_entities:
+        if save_overlay and mitigated_entities:
             overlay_path = final_output.with_suffix(".overlay.png")
             artifacts.append(render_image_overlay(mitigated_path, mitigated_entities, overlay_path))
 
@@ -82,7 +153,7 @@ class PipelineManager:
             mitigated_output=mitigated_path,
             artifacts=artifacts,
         )
-        self._attach_audit(result)
+        self._attach_audit(result, audit_logger)
         return result
 
     # --- Video Modality -----------------------------------------------
@@ -98,8 +169,23 @@ class PipelineManager:
         artifacts: list[Path] = []
         sanitized_manifest_entries: list[str] = []
 
-        for frame_path in frame_paths:
-            frame_result = self.process_image(frame_path)
+        frame_results: list[DetectionResult] = []
+        jobs: list[Job] = [("process_images", batch) for batch in self._batched(frame_paths)]
+        from ..utils.imageio import write_image
+
+        # Encode sanitized frames on two threads so PNG/JPEG encoding overlaps the next batch.
+        with ThreadPoolExecutor(max_workers=2) as encoder:
+            pending: list[Future[Path]] = []
+
+            def write(target: Path, image: np.ndarray) -> None:
+                pending.append(encoder.submit(write_image, target, image))
+
+            for batch_results in self._run_jobs(jobs, write=write):
+                frame_results.extend(batch_results)
+            for future in pending:
+                future.result()
+
+        for frame_path, frame_result in zip(frame_paths, frame_results):
             aggregated_entities.extend(frame_result.entities)
             artifacts.extend(frame_result.artifacts)
             artifacts.append(frame_path)
@@ -125,28 +211,91 @@ class PipelineManager:
         base_name = f"{source_path.stem}{suffix}"
         return Path(self.config.app.output_dir) / base_name
 
-    def process_folder(self, folder: Path, recursive: bool = True) -> list[DetectionResult]:
-        folder = Path(folder)
-        iterator = folder.rglob("*") if recursive else folder.glob("*")
-        results: list[DetectionResult] = []
-        for path in iterator:
-            if not path.is_file():
-                continue
+    def process_folder(self, folder: Path, recursive: bool = True) -> Iterator[DetectionResult]:
+        """Yield results for every supported file as soon as each one is ready."""
+
+        audit_path = self.config.explainability.audit_log_path
+        if not audit_path:
+            yield from self._process_folder(Path(folder), recursive, audit_logger=None)
+            return
+        # Share one buffered audit handle across every file in the folder (and only this folder:
+        # it is handed down explicitly, so concurrent calls on this manager keep their own).
+        with AuditLogger(audit_path) as audit_logger:
+            yield from self._process_folder(Path(folder), recursive, audit_logger=audit_logger)
+
+    def _process_folder(
+        self, folder: Path, recursive: bool, audit_logger: AuditLogger | None
+    ) -> Iterator[DetectionResult]:
+        jobs: list[Job] = []
+        image_paths: list[Path] = []
+        for path in _walk_files(folder, recursive):
             suffix = path.suffix.lower()
             if suffix in TEXT_EXTENSIONS:
-                results.append(self.process_text(path))
+                jobs.append(("_process_text_files", [path]))
             elif suffix in IMAGE_EXTENSIONS:
+                image_paths.append(path)
+        jobs.extend(("_process_image_batch", batch) for batch in self._batched(image_paths))
+        for job_results in self._run_jobs(jobs, audit_logger=audit_logger):
+            yield from job_results
+
+    def _run_jobs(self, jobs: Iterable[Job], **context: Any) -> Iterator[list[DetectionResult]]:
+        """Run jobs on the configured executor, yielding each job's results in submission order.
+
+        ``context`` holds keyword arguments for the job methods (audit handle, writer). It stays in
+        this process: worker processes cannot share it and write their own outputs instead.
+        """
+
+        submit: Callable[[str, list[Path]], Future[list[DetectionResult]]]
+        executor: Executor
+        if self.config.app.executor == "process":
+            # Each worker process loads its own models once and keeps them for every job it runs.
+            workers = max(1, self.config.app.max_workers or os.cpu_count() or 1)
+            executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(self.config,)
+            )
+            submit = partial(executor.submit, _run_worker_job)
+        else:
+            # Threads overlap file decode/encode with model inference; detectors serialize their own models.
+            workers = max(1, self.config.app.max_workers or min(os.cpu_count() or 1, MAX_FOLDER_WORKERS))
+            executor = ThreadPoolExecutor(max_workers=workers)
+
+            def submit(method: str, paths: list[Path]) -> Future[list[DetectionResult]]:
+                return executor.submit(getattr(self, method), paths, **context)
+
+        with executor:
+            yield from _bounded_map(submit, jobs, window=2 * workers)
+
+    def _process_text_files(
+        self, paths: list[Path], audit_logger: AuditLogger | None = None
+    ) -> list[DetectionResult]:
+        return [self.process_text(path, audit_logger=audit_logger) for path in paths]
+
+    def _process_image_batch(
+        self, paths: list[Path], audit_logger: AuditLogger | None = None
+    ) -> list[DetectionResult]:
+        try:
+            return self.process_images(paths, audit_logger=audit_logger)
+        except FileNotFoundError:
+            # One unreadable file fails the whole batch; retry individually to isolate it.
+            results: list[DetectionResult] = []
+            for path in paths:
                 try:
-                    results.append(self.process_image(path))
+                    results.append(self.process_image(path, audit_logger=audit_logger))
                 except FileNotFoundError:
                     LOGGER.warning("Skipping unreadable image: %s", path)
-        return results
+            return results
+
+    def _batched(self, paths: list[Path]) -> list[list[Path]]:
+        size = max(1, self.config.image.ocr_batch_size)
+        return [paths[index : index + size] for index in range(0, len(paths), size)]
 
-    def _attach_audit(self, result: DetectionResult) -> None:
+    def _attach_audit(self, result: DetectionResult, audit_logger: AuditLogger | None = None) -> None:
         if not self.config.explainability.audit_log_path:
             return
-        audit_path = record_audit(result, self.config.explainability)
-        result.audit_log = audit_path
+        if audit_logger is not None:
+            result.audit_log = audit_logger.write(result)
+            return
+        result.audit_log = record_audit(result, self.config.explainability)
 
     def _process_text_payload(
         self,
@@ -154,6 +303,7 @@ class PipelineManager:
         raw_text: str,
         suffix: str,
         modality: Modality,
+        audit_logger: AuditLogger | None = None,
     ) -> DetectionResult:
         entities = self.text_detector.detect(raw_text)
         sanitized_text, mitigated_entities = self.text_mitigator.mitigate(raw_text, entities)
@@ -172,5 +322,97 @@ class PipelineManager:
             mitigated_output=output_path,
             artifacts=artifacts,
         )
-        self._attach_audit(result)
+        self._attach_audit(result, audit_logger)
         return result
+
+
+def _read_text(path: Path) -> str:
+    """``Path.read_text`` equivalent that decodes straight from a memory map.
+
+    The file's bytes are never copied into an intermediate ``bytes`` object or
+    chunked decode buffers, so peak memory is just the resulting ``str``.
+    """
+
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:  # zero-length files cannot be mapped
+            return ""
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            text = str(mapped, "utf-8")
+    if "\r" in text:  # match text-mode universal newlines
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _walk_files(folder: Path, recursive: bool) -> Iterator[Path]:
+    """Yield regular files under ``folder`` (symlinks to files included).
+
+    ``scandir`` entries carry their type from the directory listing, so unlike
+    ``rglob("*")`` + ``is_file()`` only symlinks cost a ``stat``; dangling links,
+    FIFOs and sockets are skipped. Like ``os.walk``, unreadable directories are
+    skipped and directory symlinks are not followed.
+    """
+
+    pending = [folder]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                subdirs = []
+                for entry in entries:
+                    if entry.is_file():
+                        yield Path(entry.path)
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+        pending.extend(reversed(subdirs))
+
+
+@lru_cache(maxsize=None)
+def _get_text_detector(config_json: str) -> TextDetector:
+    """Return the process-wide TextDetector (and its spaCy model) for a serialized config."""
+
+    return TextDetector(TextConfig.model_validate_json(config_json))
+
+
+@lru_cache(maxsize=None)
+def _get_image_detector(config_json: str, text_config_json: str) -> "ImageDetector":
+    """Return the process-wide ImageDetector, sharing the cached TextDetector for its OCR text."""
+
+    from ..detection.image import ImageDetector
+
+    return ImageDetector(
+        ImageConfig.model_validate_json(config_json),
+        text_detector=_get_text_detector(text_config_json),
+    )
+
+
+_WORKER_MANAGER: PipelineManager | None = None
+
+
+def _init_worker(config: LeakWatchConfig) -> None:
+    """Build the per-process PipelineManager used by every job sent to this worker."""
+
+    global _WORKER_MANAGER
+    _WORKER_MANAGER = PipelineManager(config)
+
+
+def _run_worker_job(method: str, paths: list[Path]) -> list[DetectionResult]:
+    if _WORKER_MANAGER is None:
+        raise RuntimeError("Worker process was not initialised with a pipeline.")
+    return getattr(_WORKER_MANAGER, method)(paths)
+
+
+def _bounded_map(
+    submit: Callable[[str, list[Path]], Future[list[DetectionResult]]],
+    jobs: Iterable[Job],
+    window: int,
+) -> Iterator[list[DetectionResult]]:
+    """Run jobs with at most ``window`` in flight, yielding results in submission order."""
+
+    pending: deque[Future[list[DetectionResult]]] = deque()
+    for method, paths in jobs:
+        pending.append(submit(method, paths))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+import re
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import yaml
 from pydantic import BaseModel, Field, field_validator
@@ -12,6 +13,13 @@ from pydantic import BaseModel, Field, field_validator
 CONFIG_PATH = Path("config/leakwatch.yaml")
 
 
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str, flags: int) -> re.Pattern[str]:
+    """Shared compile cache: equal configs (reloads, detector caches, worker copies) reuse one object."""
+
+    return re.compile(pattern, flags)
+
+
 class RegexEntityConfig(BaseModel):
     """Regex detector configuration for text modality."""
 
@@ -19,6 +27,23 @@ class RegexEntityConfig(BaseModel):
     pattern: str
     action: str = "mask"
 
+    @field_validator("pattern")
+    @classmethod
+    def _check_pattern(cls, value: str) -> str:
+        """Reject malformed regexes at config load instead of at detector start-up."""
+
+        try:
+            _compile_pattern(value, re.IGNORECASE)
+        except re.error as exc:
+            raise ValueError(f"invalid regex: {exc}") from exc
+        return value
+
+    @cached_property
+    def compiled(self) -> re.Pattern[str]:
+        """Case-insensitive compiled pattern, built once per config entry."""
+
+        return _compile_pattern(self.pattern, re.IGNORECASE)
+
 
 class TextConfig(BaseModel):
     enable_spacy: bool = True
@@ -30,9 +55,18 @@ class TextConfig(BaseModel):
 
 class ImageConfig(BaseModel):
     face_blur_kernel: int = 35
+    face_detector: str = "haar"
+    face_model_path: Path = Path("models/face_detection_yunet_2023mar.onnx")
+    face_score_threshold: float = 0.8
     text_detection_langs: list[str] = Field(default_factory=lambda: ["en"])
     min_confidence: float = 0.3
     enable_ocr: bool = True
+    ocr_quantize: bool = True
+    ocr_edge_gate: float = 0.0
+    detect_min_side: int = 2000
+    ocr_batch_size: int = 8
+    ocr_batch_width: int = 800  # warm-up frame size; real batches keep each image's own size
+    ocr_batch_height: int = 600
 
     @field_validator("face_blur_kernel")
     @classmethod
@@ -55,6 +89,8 @@ class ModalityToggle(BaseModel):
 class AppConfig(BaseModel):
     mode: str = "cli"
     output_dir: Path = Path("artifacts")
+    executor: Literal["thread", "process"] = "thread"
+    max_workers: int = 0  # 0 picks a default from the CPU count
 
 
 class LeakWatchConfig(BaseModel):
@@ -0,0 +1,78 @@
+"""Image decoding helpers shared by detection, mitigation and explainability."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+_REDUCED_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+EXIF_ORIENTATION = 0x0112
+# EXIF orientations 5-8 rotate by 90 or 270 degrees, swapping width and height.
+_TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
+
+
+def read_image(path: Path, reduction: int = 1) -> np.ndarray:
+    """Decode an image straight from a memory-mapped file.
+
+    ``reduction`` (1, 2, 4 or 8) lets libjpeg/libpng skip work by decoding at a
+    fraction of the stored resolution. Raises ``FileNotFoundError`` when the
+    file is missing, empty or not a decodable image, mirroring ``cv2.imread``
+    returning ``None``.
+    """
+
+    try:
+        buffer = np.memmap(path, dtype=np.uint8, mode="r")
+    except (OSError, ValueError) as exc:  # missing or zero-length file
+        raise FileNotFoundError(f"Unable to load image: {path}") from exc
+    image = cv2.imdecode(buffer, _REDUCED_FLAGS[reduction])
+    if image is None:
+        raise FileNotFoundError(f"Unable to load image: {path}")
+    return image
+
+
+def write_image(path: Path, image: np.ndarray) -> Path:
+    """Encode ``image`` in memory using the suffix's codec and write it with a single syscall."""
+
+    ok, buffer = cv2.imencode(Path(path).suffix, image)
+    if not ok:
+        raise ValueError(f"Unable to encode image: {path}")
+    Path(path).write_bytes(buffer.tobytes())
+    return Path(path)
+
+
+def image_size(path: Path) -> tuple[int, int] | None:
+    """Return ``(width, height)`` as decoded, from the file header without decoding pixels.
+
+    OpenCV applies the EXIF orientation on decode, so rotated JPEGs report swapped sides.
+    """
+
+    try:  # Pillow only parses the header on open; pixels are never decoded here.
+        from PIL import Image
+    except ImportError:  # pragma: no cover
+        return None
+    try:
+        with Image.open(path) as handle:
+            width, height = handle.size
+            orientation = handle.getexif().get(EXIF_ORIENTATION, 1)
+    except (OSError, Image.DecompressionBombError):  # unreadable, or too large for Pillow to open
+        return None
+    return (height, width) if orientation in _TRANSPOSED_ORIENTATIONS else (width, height)
+
+
+def decode_reduction(size: tuple[int, int] | None, min_side: int) -> int:
+    """Largest power-of-two reduction that keeps the longest side ``>= min_side``."""
+
+    if size is None or min_side <= 0:
+        return 1
+    longest = max(size)
+    reduction = 1
+    while reduction < 8 and longest // (reduction * 2) >= min_side:
+        reduction *= 2
+    return reduction
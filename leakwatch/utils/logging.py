@@ -5,17 +5,12 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-_LOGGER: logging.Logger | None = None
-
-
 def get_logger(name: str = "leakwatch") -> logging.Logger:
-    global _LOGGER
-    if _LOGGER is None:
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-        )
-        _LOGGER = logging.getLogger(name)
+    # basicConfig is a thread-safe no-op once the root logger has handlers.
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    )
     return logging.getLogger(name)
 
 
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict, dataclass, replace
 from enum import Enum
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, Sequence
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 
@@ -16,19 +18,24 @@ class Modality(str, Enum):
     VIDEO = "video"
 
 
-class Span(BaseModel):
+# Per-entity types are slotted dataclasses: detectors and mitigators build thousands of them,
+# and pydantic still validates/serializes them wherever they sit inside a DetectionResult.
+@dataclass(slots=True)
+class Span:
     start: int
     end: int
 
 
-class BoundingBox(BaseModel):
+@dataclass(slots=True)
+class BoundingBox:
     x: int
     y: int
     width: int
     height: int
 
 
-class DetectedEntity(BaseModel):
+@dataclass(slots=True)
+class DetectedEntity:
     modality: Modality
     label: str
     confidence: float
@@ -38,6 +45,66 @@ class DetectedEntity(BaseModel):
     mitigation: Literal["mask", "blur", "replace", "none"] = "none"
     explanation: str | None = None
 
+    def model_copy(self, update: dict[str, Any] | None = None) -> "DetectedEntity":
+        """Pydantic-compatible shim over ``dataclasses.replace``."""
+
+        return replace(self, **(update or {}))
+
+    def model_dump(self) -> dict[str, Any]:
+        """Pydantic-compatible shim over ``dataclasses.asdict``."""
+
+        return asdict(self)
+
+
+@dataclass
+class EntityBatch:
+    """Columnar (struct-of-arrays) view over the bbox-bearing entities of one image.
+
+    Bulk image passes (mitigation, overlays) read coordinates from ``xyxy``
+    rows instead of reading attributes off each entity; ``indices`` maps every row
+    back to its entity in the source list.
+    """
+
+    xyxy: np.ndarray  # (N, 4) int32: x0, y0, x1, y1
+    conf: np.ndarray  # (N,) float32
+    labels: list[str]
+    texts: list[str | None]
+    mitigations: list[str]
+    indices: np.ndarray  # (N,) intp
+
+    @classmethod
+    def from_entities(cls, entities: Sequence["DetectedEntity"]) -> "EntityBatch":
+        # One pass over the entities; the (x, y, w, h) rows become xyxy with a single vector add.
+        boxes: list[tuple[int, int, int, int]] = []
+        conf: list[float] = []
+        labels: list[str] = []
+        texts: list[str | None] = []
+        mitigations: list[str] = []
+        indices: list[int] = []
+        for index, ent in enumerate(entities):
+            bbox = ent.bbox
+            if bbox is None:
+                continue
+            boxes.append((bbox.x, bbox.y, bbox.width, bbox.height))
+            conf.append(ent.confidence)
+            labels.append(ent.label)
+            texts.append(ent.text)
+            mitigations.append(ent.mitigation)
+            indices.append(index)
+        xyxy = np.array(boxes, dtype=np.int32).reshape(-1, 4)
+        xyxy[:, 2:] += xyxy[:, :2]
+        return cls(
+            xyxy=xyxy,
+            conf=np.array(conf, dtype=np.float32),
+            labels=labels,
+            texts=texts,
+            mitigations=mitigations,
+            indices=np.array(indices, dtype=np.intp),
+        )
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
 
 class DetectionResult(BaseModel):
     source_path: Path
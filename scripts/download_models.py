@@ -4,16 +4,35 @@ from __future__ import annotations
 
 import subprocess
 import sys
+import urllib.request
+from pathlib import Path
 
 MODELS = [
     ("python", "-m", "spacy", "download", "en_core_web_sm"),
 ]
 
+ROOT = Path(__file__).resolve().parents[1]
+YUNET_URL = (
+    "https://github.com/opencv/opencv_zoo/raw/main/models/face_detection_yunet/"
+    "face_detection_yunet_2023mar.onnx"
+)
+YUNET_PATH = ROOT / "models" / "face_detection_yunet_2023mar.onnx"
+
+
+def download_yunet() -> None:
+    if YUNET_PATH.exists():
+        print(f"YuNet model already present: {YUNET_PATH}")
+        return
+    YUNET_PATH.parent.mkdir(parents=True, exist_ok=True)
+    print(f"Downloading: {YUNET_URL}")
+    urllib.request.urlretrieve(YUNET_URL, YUNET_PATH)
+
 
 def main() -> None:
     for cmd in MODELS:
         print(f"Running: {' '.join(cmd)}")
         subprocess.run(cmd, check=True)
+    download_yunet()
 
 
 if __name__ == "__main__":
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import math
 from pathlib import Path
+import shutil
+import subprocess
 import wave
 
 import cv2
@@ -26,32 +28,64 @@ def build_demo_audio() -> None:
         wf.setsampwidth(2)
         wf.setframerate(framerate)
         total_frames = int(duration_seconds * framerate)
-        frames = bytearray()
-        for i in range(total_frames):
-            value = int(amplitude * math.sin(2 * math.pi * frequency * (i / framerate)))
-            frames += value.to_bytes(2, byteorder="little", signed=True)
-        wf.writeframes(frames)
+        # A tone at an integer frequency repeats every framerate / gcd(framerate, frequency)
+        # samples: synthesize one period and tile it instead of evaluating sin for every sample.
+        if float(frequency).is_integer():
+            period = framerate // math.gcd(framerate, int(frequency))
+        else:
+            period = total_frames
+        # float64 + truncating int16 cast matches int(amplitude * math.sin(...)) sample for sample.
+        t = np.arange(min(period, total_frames)) / framerate
+        one_period = (amplitude * np.sin(2 * np.pi * frequency * t)).astype("<i2")
+        samples = np.resize(one_period, total_frames)  # repeats the period to the full length
+        wf.writeframes(samples)  # buffer protocol: no intermediate bytes copy
     print(f"Created demo audio: {path}")
 
 
+def _open_ffmpeg(path: Path, width: int, height: int, fps: int) -> subprocess.Popen[bytes] | None:
+    """Start an ffmpeg process encoding raw BGR frames from stdin to H.264, if ffmpeg is on PATH."""
+
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return None
+    command = [
+        ffmpeg, "-y", "-loglevel", "error",
+        "-f", "rawvideo", "-pix_fmt", "bgr24", "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+        "-c:v", "libx264", "-pix_fmt", "yuv420p", str(path),
+    ]  # fmt: skip
+    return subprocess.Popen(command, stdin=subprocess.PIPE)
+
+
 def build_demo_video() -> None:
     path = VIDEO_DIR / "demo_clip.mp4"
     VIDEO_DIR.mkdir(parents=True, exist_ok=True)
     fps = 10
     frame_count = 40
     width, height = 320, 240
-    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-    writer = cv2.VideoWriter(str(path), fourcc, fps, (width, height))
-    if not writer.isOpened():
-        raise RuntimeError("Unable to open video writer; check OpenCV build")
+    # Prefer piping raw frames to ffmpeg (native H.264); fall back to OpenCV's mp4v writer.
+    ffmpeg = _open_ffmpeg(path, width, height, fps)
+    writer = None
+    if ffmpeg is None:
+        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+        writer = cv2.VideoWriter(str(path), fourcc, fps, (width, height))
+        if not writer.isOpened():
+            raise RuntimeError("Unable to open video writer; check OpenCV build")
+    # One scratch frame, refilled in place: every pixel is overwritten, so no per-frame zeroing.
+    frame = np.empty((height, width, 3), dtype=np.uint8)
     for idx in range(frame_count):
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
-        color = ((idx * 5) % 255, (idx * 3) % 255, (idx * 7) % 255)
-        frame[:] = color
+        frame[:] = ((idx * 5) % 255, (idx * 3) % 255, (idx * 7) % 255)
         text = f"Frame {idx:02d}"
         cv2.putText(frame, text, (40, height // 2), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
-        writer.write(frame)
-    writer.release()
+        if ffmpeg is not None:
+            ffmpeg.stdin.write(frame.data)
+        else:
+            writer.write(frame)
+    if ffmpeg is not None:
+        ffmpeg.stdin.close()
+        if ffmpeg.wait() != 0:
+            raise RuntimeError("ffmpeg failed to encode the demo video")
+    else:
+        writer.release()
     print(f"Created demo video: {path}")
 
 
@@ -0,0 +1,35 @@
+import pytest
+
+from leakwatch.orchestration import PipelineManager
+from leakwatch.utils.config import (
+    AppConfig,
+    ExplainabilityConfig,
+    ImageConfig,
+    LeakWatchConfig,
+    RegexEntityConfig,
+    TextConfig,
+)
+
+
+@pytest.fixture(scope="session")
+def pipeline_manager(tmp_path_factory):
+    """Text pipeline shared by the whole session so its detectors are built once."""
+
+    base = tmp_path_factory.mktemp("pipeline")
+    config = LeakWatchConfig(
+        app=AppConfig(output_dir=base / "artifacts"),
+        text=TextConfig(
+            enable_spacy=False,
+            regex_entities=[
+                RegexEntityConfig(name="phone", pattern=r"\d{3}-\d{3}-\d{4}", action="mask"),
+                RegexEntityConfig(name="email", pattern=r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", action="mask"),
+            ],
+        ),
+        image=ImageConfig(enable_ocr=False),
+        explainability=ExplainabilityConfig(
+            save_text_spans=True,
+            save_image_overlays=False,
+            audit_log_path=base / "audit.log",
+        ),
+    )
+    return PipelineManager(config)
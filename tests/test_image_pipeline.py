@@ -0,0 +1,239 @@
+import json
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+from pydantic import ValidationError
+
+from leakwatch.detection import ImageDetector
+from leakwatch.mitigation import ImageMitigator
+from leakwatch.orchestration import PipelineManager
+from leakwatch.utils.types import BoundingBox, DetectedEntity, Modality
+from leakwatch.utils.config import (
+    AppConfig,
+    ExplainabilityConfig,
+    ImageConfig,
+    LeakWatchConfig,
+    TextConfig,
+)
+
+
+def _config(tmp_path, executor="thread", overlays=False, **image_overrides):
+    return LeakWatchConfig(
+        app=AppConfig(output_dir=tmp_path / "artifacts", executor=executor, max_workers=2),
+        text=TextConfig(enable_spacy=False),
+        image=ImageConfig(enable_ocr=False, **image_overrides),
+        explainability=ExplainabilityConfig(
+            save_text_spans=False,
+            save_image_overlays=overlays,
+            audit_log_path=tmp_path / "audit.log",
+        ),
+    )
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_folder_scan_batches_images_and_skips_unreadable(tmp_path, executor):
+    folder = tmp_path / "uploads"
+    folder.mkdir()
+    for index, (height, width) in enumerate([(120, 160), (90, 200), (120, 160)]):
+        image = np.full((height, width, 3), 40 * index, dtype=np.uint8)
+        cv2.imwrite(str(folder / f"image_{index}.png"), image)
+    (folder / "broken.png").write_bytes(b"not an image")
+
+    manager = PipelineManager(_config(tmp_path, executor=executor, ocr_batch_size=2))
+    results = list(manager.process_folder(folder))
+
+    sources = sorted(result.source_path.name for result in results)
+    assert sources == ["image_0.png", "image_1.png", "image_2.png"]
+    for result in results:
+        assert result.mitigated_output is not None
+        assert result.mitigated_output.exists()
+
+    audit_lines = (tmp_path / "audit.log").read_text(encoding="utf-8").splitlines()
+    assert len(audit_lines) == 3
+    assert all(json.loads(line)["modality"] == "image" for line in audit_lines)
+
+
+def test_image_overlay_is_rendered_after_mitigation(tmp_path, monkeypatch):
+    source = tmp_path / "photo.png"
+    cv2.imwrite(str(source), np.full((120, 160, 3), 200, dtype=np.uint8))
+    face = DetectedEntity(
+        modality=Modality.IMAGE, label="face", confidence=0.9, bbox=BoundingBox(x=20, y=20, width=40, height=40)
+    )
+
+    manager = PipelineManager(_config(tmp_path, overlays=True))
+    detect_and_load = manager.image_detector.detect_and_load
+    monkeypatch.setattr(
+        manager.image_detector, "detect_and_load", lambda paths: ([[face]], detect_and_load(paths)[1])
+    )
+    result = manager.process_image(source)
+
+    assert [entity.mitigation for entity in result.entities] == ["blur"]
+    assert result.mitigated_output.exists()
+    assert [artifact.name for artifact in result.artifacts] == ["photo.sanitized.overlay.png"]
+    assert result.artifacts[0].exists()
+
+
+@pytest.mark.parametrize("shape", [(1000, 1000), (1200, 800), (1920, 1080)])
+def test_edge_gate_keeps_a_single_line_of_text(shape):
+    page = np.full((*shape, 3), 255, dtype=np.uint8)
+    blank = page.copy()
+    cv2.putText(page, "SSN 123-45-6789", (40, shape[0] // 2), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 0), 2)
+
+    assert ImageConfig().ocr_edge_gate == 0  # skipping detection is opt-in
+    detector = ImageDetector(ImageConfig(ocr_edge_gate=0.01))
+    assert detector._has_text_hint(page)
+    assert not detector._has_text_hint(blank)
+
+
+def test_reduced_decode_scale_follows_exif_orientation(tmp_path):
+    source = tmp_path / "rotated.jpg"
+    exif = Image.Exif()
+    exif[0x0112] = 6  # rotate 90 degrees on display
+    Image.new("RGB", (4400, 3000), "white").save(source, exif=exif.tobytes())
+
+    image, scale = ImageDetector(ImageConfig(detect_min_side=2000))._load_image(source)
+
+    assert image.shape[:2] == (2200, 1500)
+    assert scale == (2.0, 2.0)
+
+
+def test_video_background_writes_do_not_capture_concurrent_image_calls(tmp_path, monkeypatch):
+    frames = []
+    for index in range(2):
+        frames.append(tmp_path / f"frame_{index}.png")
+        cv2.imwrite(str(frames[-1]), np.full((60, 80, 3), 90, dtype=np.uint8))
+    photo = tmp_path / "photo.png"
+    cv2.imwrite(str(photo), np.full((60, 80, 3), 30, dtype=np.uint8))
+
+    config = _config(tmp_path)
+    config.video.enabled = True
+    manager = PipelineManager(config)
+    monkeypatch.setattr(manager.video_adapter, "extract_frames", lambda source, frame_dir: frames)
+    detect_and_load = manager.image_detector.detect_and_load
+    photo_results = []
+
+    def detect_during_video(paths):
+        if paths != [photo] and not photo_results:  # another request arriving mid-video
+            photo_results.append(manager.process_image(photo))
+            photo_results.append(photo_results[0].mitigated_output.exists())
+        return detect_and_load(paths)
+
+    monkeypatch.setattr(manager.image_detector, "detect_and_load", detect_during_video)
+    result = manager.process_video(tmp_path / "clip.mp4")
+
+    assert photo_results[1], "process_image returned before its sanitized file was written"
+    assert all(Path(path).exists() for path in result.mitigated_output.read_text().splitlines())
+
+
+def test_unknown_executor_is_rejected():
+    with pytest.raises(ValidationError):
+        AppConfig(executor="proces")
+
+
+class _StubReader:
+    """Records the frames OCR sees and reports one fixed quad per frame."""
+
+    QUAD = [(100, 100), (300, 100), (300, 140), (100, 140)]
+
+    def __init__(self):
+        self.calls = []
+
+    def readtext(self, frame):
+        self.calls.append(("single", [frame.shape]))
+        return [(self.QUAD, "label", 0.9)]
+
+    def readtext_batched(self, frames, **kwargs):
+        self.calls.append(("batched", [frame.shape for frame in frames]))
+        return [[(self.QUAD, "label", 0.9)] for _ in frames]
+
+
+def test_mixed_size_ocr_batches_keep_native_frames_and_map_boxes_back(tmp_path):
+    shapes = [(1920, 1080), (600, 800), (3000, 4000), (600, 800)]
+    paths = []
+    for index, (height, width) in enumerate(shapes):
+        paths.append(tmp_path / f"image_{index}.png")
+        cv2.imwrite(str(paths[-1]), np.full((height, width, 3), 255, dtype=np.uint8))
+    detector = ImageDetector(ImageConfig(detect_min_side=2000))
+    detector._ocr_reader = _StubReader()
+
+    results = detector.detect_batch(paths)
+
+    # No frame is stretched to a shared size: same-sized frames are batched, the rest go alone.
+    assert sorted(detector._ocr_reader.calls) == [
+        ("batched", [(600, 800, 3), (600, 800, 3)]),
+        ("single", [(1500, 2000, 3)]),  # decoded at half resolution for detection
+        ("single", [(1920, 1080, 3)]),
+    ]
+    boxes = [[(e.bbox.x, e.bbox.y, e.bbox.width, e.bbox.height) for e in found] for found in results]
+    assert boxes == [[(100, 100, 200, 40)], [(100, 100, 200, 40)], [(200, 200, 400, 80)], [(100, 100, 200, 40)]]
+
+
+def test_face_blur_strength_follows_the_configured_kernel():
+    roi = np.random.default_rng(0).integers(0, 256, (240, 240, 3), dtype=np.uint8)
+
+    spread = {
+        kernel: float(ImageMitigator(ImageConfig(face_blur_kernel=kernel))._blur_region(roi).std())
+        for kernel in (9, 35, 99)
+    }
+
+    assert spread[9] > spread[35] > spread[99]
+    # Comparable to the Gaussian the setting names, within the pyramid's approximation.
+    reference = float(cv2.GaussianBlur(roi, (35, 35), 0).std())
+    assert 0.7 * reference < spread[35] < 1.3 * reference
+
+
+class _FakeYuNet:
+    """Stands in for ``cv2.FaceDetectorYN``: records its setup, returns fixed face rows."""
+
+    created = {}
+    FACES = np.array(
+        [
+            [-10, -5, 50, 40] + [0] * 10 + [0.95],  # cut by the top-left corner
+            [140, 100, 40, 40] + [0] * 10 + [0.9],  # overflows the bottom-right corner
+            [200, 10, 20, 20] + [0] * 10 + [0.85],  # entirely outside the frame
+        ],
+        dtype=np.float32,
+    )
+
+    @classmethod
+    def create(cls, model, config, input_size, score_threshold):
+        cls.created = {"model": model, "score_threshold": score_threshold}
+        return cls()
+
+    def setInputSize(self, size):
+        self.input_size = size
+
+    def detect(self, image):
+        return 1, self.FACES
+
+
+def test_yunet_boxes_are_clipped_to_the_frame(tmp_path, monkeypatch):
+    model = tmp_path / "yunet.onnx"
+    model.write_bytes(b"onnx")
+    monkeypatch.setattr(cv2, "FaceDetectorYN", _FakeYuNet)
+    detector = ImageDetector(
+        ImageConfig(face_detector="yunet", face_model_path=model, face_score_threshold=0.6, enable_ocr=False)
+    )
+
+    faces = list(detector._detect_faces(np.zeros((120, 160, 3), dtype=np.uint8)))
+
+    assert _FakeYuNet.created == {"model": str(model), "score_threshold": 0.6}
+    assert detector._face_net.input_size == (160, 120)
+    boxes = [(face.bbox.x, face.bbox.y, face.bbox.width, face.bbox.height) for face in faces]
+    assert boxes == [(0, 0, 40, 35), (140, 100, 20, 20)]
+    assert [face.confidence for face in faces] == pytest.approx([0.95, 0.9])
+
+
+def test_missing_yunet_model_falls_back_to_haar(tmp_path, caplog):
+    config = ImageConfig(face_detector="yunet", face_model_path=tmp_path / "missing.onnx", enable_ocr=False)
+
+    with caplog.at_level("WARNING"):
+        detector = ImageDetector(config)
+
+    assert detector._face_net is None
+    assert detector._face_cascade is not None and not detector._face_cascade.empty()
+    assert "falling back to Haar cascade" in caplog.text
+    assert list(detector._detect_faces(np.zeros((120, 160, 3), dtype=np.uint8))) == []
@@ -1,40 +1,27 @@
+import json
+import os
+import random
+import re
+import subprocess
+import sys
 from pathlib import Path
+from types import SimpleNamespace
 
-from leakwatch.orchestration import PipelineManager
-from leakwatch.utils.config import (
-    AppConfig,
-    ExplainabilityConfig,
-    ImageConfig,
-    LeakWatchConfig,
-    RegexEntityConfig,
-    TextConfig,
-)
+import pytest
+
+from leakwatch.detection import TextDetector
+from leakwatch.detection import text as text_detection
+from leakwatch.detection.text import _required_bytes
+from leakwatch.mitigation import TextMitigator
+from leakwatch.utils.config import RegexEntityConfig, TextConfig
 
 
-def test_text_pipeline_creates_artifacts(tmp_path):
+def test_text_pipeline_creates_artifacts(tmp_path, pipeline_manager):
     input_text = "Reach me at 123-456-7890 and email me@sample.com"
     sample = tmp_path / "input.txt"
     sample.write_text(input_text, encoding="utf-8")
 
-    config = LeakWatchConfig(
-        app=AppConfig(output_dir=tmp_path / "artifacts"),
-        text=TextConfig(
-            enable_spacy=False,
-            regex_entities=[
-                RegexEntityConfig(name="phone", pattern=r"\d{3}-\d{3}-\d{4}", action="mask"),
-                RegexEntityConfig(name="email", pattern=r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", action="mask"),
-            ],
-        ),
-        image=ImageConfig(enable_ocr=False),
-        explainability=ExplainabilityConfig(
-            save_text_spans=True,
-            save_image_overlays=False,
-            audit_log_path=tmp_path / "audit.log",
-        ),
-    )
-
-    manager = PipelineManager(config)
-    result = manager.process_text(sample)
+    result = pipeline_manager.process_text(sample)
 
     assert result.mitigated_output is not None
     sanitized_text = Path(result.mitigated_output).read_text(encoding="utf-8")
@@ -45,4 +32,168 @@ def test_text_pipeline_creates_artifacts(tmp_path):
         assert artifact.exists()
 
     assert result.audit_log is not None
-    assert Path(result.audit_log).exists()
\ No newline at end of file
+    assert Path(result.audit_log).exists()
+
+
+def test_folder_scan_skips_entries_that_are_not_regular_files(tmp_path, pipeline_manager):
+    folder = tmp_path / "uploads"
+    (folder / "nested").mkdir(parents=True)
+    (folder / "a.txt").write_text("mail me@sample.com", encoding="utf-8")
+    (folder / "nested" / "b.txt").write_text("call 123-456-7890", encoding="utf-8")
+    (folder / "link.txt").symlink_to(folder / "a.txt")
+    (folder / "dangling.txt").symlink_to(folder / "missing.txt")
+    if hasattr(os, "mkfifo"):
+        os.mkfifo(folder / "pipe.txt")
+
+    results = list(pipeline_manager.process_folder(folder))
+
+    assert sorted(result.source_path.name for result in results) == ["a.txt", "b.txt", "link.txt"]
+
+
+def test_calls_during_a_folder_scan_keep_their_own_audit_records(tmp_path, pipeline_manager):
+    folder = tmp_path / "uploads"
+    folder.mkdir()
+    for index in range(2):
+        (folder / f"{index}.txt").write_text("mail me@sample.com", encoding="utf-8")
+    other = tmp_path / "other.txt"
+    other.write_text("call 123-456-7890", encoding="utf-8")
+    audit_path = Path(pipeline_manager.config.explainability.audit_log_path)
+
+    scan = pipeline_manager.process_folder(folder)
+    next(scan)  # the scan's buffered audit handle is open from here on
+    pipeline_manager.process_text(other)
+    sources = [json.loads(line)["source"] for line in audit_path.read_text(encoding="utf-8").splitlines()]
+    rest = list(scan)
+
+    assert str(other) in sources  # on disk already, not parked in the scan's buffer
+    assert len(rest) == 1
+
+
+def test_text_runs_never_import_opencv(tmp_path):
+    sample = tmp_path / "input.txt"
+    sample.write_text("mail me@sample.com", encoding="utf-8")
+    script = f"""
+import sys
+from leakwatch.orchestration import PipelineManager
+from leakwatch.utils.config import AppConfig, ExplainabilityConfig, LeakWatchConfig, TextConfig
+config = LeakWatchConfig(
+    app=AppConfig(output_dir={str(tmp_path / "artifacts")!r}),
+    text=TextConfig(enable_spacy=False),
+    explainability=ExplainabilityConfig(audit_log_path={str(tmp_path / "audit.log")!r}),
+)
+PipelineManager(config).process_text({str(sample)!r})
+print(sorted(name for name in ("cv2", "leakwatch.detection.image", "leakwatch.mitigation.image") if name in sys.modules))
+"""
+    repo_root = Path(__file__).resolve().parents[1]
+    completed = subprocess.run([sys.executable, "-c", script], cwd=repo_root, capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == "[]"
+
+
+def test_mitigated_spans_point_into_sanitized_text():
+    config = TextConfig(
+        enable_spacy=False,
+        regex_entities=[
+            RegexEntityConfig(name="phone", pattern=r"\d{3}-\d{4}"),
+            RegexEntityConfig(name="digits", pattern=r"\d{3}"),
+            RegexEntityConfig(name="email", pattern=r"\w+@\w+\.com"),
+        ],
+    )
+    text = "Call 555-1234 or mail a@b.com today"
+    entities = TextDetector(config).detect(text)
+
+    sanitized, mitigated = TextMitigator(config).mitigate(text, entities)
+
+    assert sanitized == "Call [REDACTED:PHONE] or mail [REDACTED:EMAIL] today"
+    assert len(mitigated) == len(entities)
+    for entity in mitigated:
+        assert sanitized[entity.span.start : entity.span.end] == entity.text
+        assert entity.explanation in text
+
+
+def test_keyword_patterns_keep_regex_match_semantics():
+    patterns = {"codename": r"ab|abc|b", "marking": r"top\.secret|secret"}
+    config = TextConfig(
+        enable_spacy=False,
+        regex_entities=[RegexEntityConfig(name=name, pattern=pattern) for name, pattern in patterns.items()],
+    )
+    detector = TextDetector(config)
+
+    # "ſ" (long s) is matched by "s" under re.IGNORECASE although str.lower() leaves it alone.
+    for text in ["ABC abcb TOP.SECRET, secret-ab", "top.ſecret ſecret"]:
+        detected = [(ent.label, ent.span.start, ent.span.end) for ent in detector.detect(text)]
+        expected = [
+            (name, match.start(), match.end())
+            for name, pattern in patterns.items()
+            for match in re.finditer(pattern, text, re.IGNORECASE)
+        ]
+        assert detected == expected
+
+
+def test_ascii_gate_only_rules_out_patterns_that_cannot_match():
+    email = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", re.IGNORECASE)
+    phone = re.compile(r"\b(?:\+?\d{1,3}[ -]?)?(?:\d{3}[ -]?){2}\d{4}\b", re.IGNORECASE)
+
+    assert _required_bytes(email) == frozenset(b"@")
+    assert _required_bytes(phone) == frozenset(b"0123456789")
+    assert _required_bytes(re.compile(r"ab|c", re.IGNORECASE)) == frozenset(b"aAcC")
+    assert _required_bytes(re.compile(r"x?|K")) is None
+
+
+_DIFF_ATOMS = ["a", "b", "k", "s", "x", "1", "@", "-", " ", r"\.", ".", "[a-c]", "[^a]", "\u212a",
+               r"\d", r"\D", r"\w", r"\W", r"\s", r"\S"]
+_DIFF_QUANTIFIERS = ["", "", "", "?", "+", "*?", "{2}", "{1,3}", "{,3}", "{2,}"]
+_DIFF_CHARS = "abksxy19 @.-_\n\t\x0b\x1c\u00e9\u017f\u212a"
+
+
+def _random_pattern(rng, depth=0):
+    parts = []
+    for _ in range(rng.randint(1, 4)):
+        if depth < 2 and rng.random() < 0.2:
+            atom = f"(?:{_random_pattern(rng, depth + 1)}|{_random_pattern(rng, depth + 1)})"
+        else:
+            atom = rng.choice(_DIFF_ATOMS)
+        parts.append(atom + rng.choice(_DIFF_QUANTIFIERS))
+    return rng.choice(["", "^", r"\b", r"(?<!\d)"]) + "".join(parts) + rng.choice(["", "", "$", r"\b"])
+
+
+@pytest.mark.parametrize("engines", ["hyperscan", "re2", "none"])
+def test_prefilters_never_drop_a_regex_match(monkeypatch, engines):
+    if engines != "none" and getattr(text_detection, engines) is None:
+        pytest.skip(f"{engines} not installed")
+    if engines != "hyperscan":
+        monkeypatch.setattr(text_detection, "hyperscan", None)
+    if engines == "none":
+        monkeypatch.setattr(text_detection, "re2", None)
+    rng = random.Random(0)
+    for _ in range(150):
+        patterns = [_random_pattern(rng) for _ in range(3)]
+        config = TextConfig(
+            enable_spacy=False,
+            regex_entities=[RegexEntityConfig(name=str(index), pattern=p) for index, p in enumerate(patterns)],
+        )
+        detector = TextDetector(config)
+        for _ in range(3):
+            text = "".join(rng.choice(_DIFF_CHARS) for _ in range(rng.randint(1, 12)))
+            detected = sorted((ent.label, ent.span.start, ent.span.end) for ent in detector.detect(text))
+            expected = sorted(
+                (str(index), match.start(), match.end())
+                for index, pattern in enumerate(patterns)
+                for match in re.finditer(pattern, text, re.IGNORECASE)
+            )
+            assert detected == expected, (patterns, text)
+
+
+def test_pattern_analysis_survives_an_unexpected_parse_tree(monkeypatch):
+    parser = text_detection.sre_parse
+
+    class Tree(list):
+        state = SimpleNamespace(flags=0)
+
+    # A repeat node whose payload lost a field, as a future ``re._parser`` might produce.
+    odd_tree = Tree([(parser.MAX_REPEAT, (1, parser.MAXREPEAT))])
+    proxy = SimpleNamespace(**{**vars(parser), "parse": lambda pattern, flags: odd_tree})
+    monkeypatch.setattr(text_detection, "sre_parse", proxy)
+    pattern = re.compile(r"\d+")
+
+    assert _required_bytes(pattern) is None
+    assert text_detection._portable_pattern(pattern) is None